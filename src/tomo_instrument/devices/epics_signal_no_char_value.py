@@ -0,0 +1,109 @@
+"""
+EpicsSignal that skips pyepics ``char_value`` formatting on monitor updates.
+
+pyepics formats a ``char_value`` string for every monitor update of a PV.
+ophyd only uses that string for signals created with ``string=True``.
+``EpicsSignalNoCharValue`` gives its signal PV objects of its own that skip
+the formatting, so other signals of the same PVs are not affected.
+
+This relies on pyepics and ophyd internals (``PV._set_charval(call_ca=...)``,
+``PV._reference_count``).  When they are not as expected, or when the control
+layer is not pyepics, the signal behaves as a plain ``EpicsSignal``.
+"""
+
+import functools
+import inspect
+import logging
+import types
+
+from ophyd import EpicsSignal
+from ophyd import get_cl
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def _pyepics_supported() -> bool:
+    """Returns True if pyepics has the internals this module relies on."""
+    import epics
+
+    try:
+        params = inspect.signature(epics.PV._set_charval).parameters
+    except (AttributeError, TypeError, ValueError):
+        params = {}
+    supported = "call_ca" in params
+    if not supported:
+        logger.warning(
+            "pyepics %s: PV._set_charval(call_ca=...) not found,"
+            " EpicsSignalNoCharValue formats char_value as usual.",
+            getattr(epics, "__version__", "?"),
+        )
+    return supported
+
+
+def _get_pv(pvname: str, **kwargs):
+    """
+    Creates a pyepics PV that does not format ``char_value`` on monitor updates.
+
+    The PV object is not taken from (or added to) the pyepics PV cache, so
+    no other signal shares it.  The ``char_value`` property and
+    ``get(as_string=True)`` still format the value when asked.
+
+    Args:
+        pvname (str): Name of the EPICS PV.
+        **kwargs: Keyword arguments for the PV constructor.
+    """
+    import epics
+
+    pv = epics.pv.default_pv_class(pvname, **kwargs)
+
+    set_charval = pv._set_charval
+
+    def _set_charval(val, call_ca=True, **kwds):
+        # Monitor updates call with call_ca=False.
+        if call_ca:
+            return set_charval(val, call_ca=call_ca, **kwds)
+        return None
+
+    pv._set_charval = _set_charval
+    return pv
+
+
+def _release_pvs(*pvs):
+    """
+    Releases PVs made by ``_get_pv()``.
+
+    pyepics shares one CA channel between all PV objects of the same name,
+    cached or not.  Only the callbacks and the monitor of each PV are
+    cleared; the channel is left open for the other users.
+    """
+    for pv in pvs:
+        pv._reference_count -= 1
+        if pv._reference_count == 0:
+            pv.clear_callbacks()
+            pv.clear_auto_monitor()
+
+
+class EpicsSignalNoCharValue(EpicsSignal):
+    """
+    EpicsSignal for numeric PVs that skips pyepics ``char_value`` formatting.
+
+    With any other control layer than pyepics, this is a plain EpicsSignal.
+    """
+
+    def __init__(self, *args, string=False, cl=None, **kwargs):
+        """
+        Initializes the signal.
+
+        Raises:
+            ValueError: If ``string=True`` is requested.
+        """
+        if string:
+            raise ValueError(f"{type(self).__name__} does not support string=True")
+
+        cl = cl or get_cl()
+        if getattr(cl, "name", None) == "pyepics" and _pyepics_supported():
+            cl = types.SimpleNamespace(
+                **{**vars(cl), "get_pv": _get_pv, "release_pvs": _release_pvs}
+            )
+        super().__init__(*args, string=string, cl=cl, **kwargs)
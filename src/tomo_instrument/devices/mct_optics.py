@@ -5,75 +5,148 @@ This module defines device classes for managing MCT optics via EPICS.
 Each class is designed to interact with specific subsystems,
 facilitating ease of use and configurability.
 
+All signals use the one Channel Access context of the ophyd control layer.
+Channel Access already carries every channel to the same IOC over a single
+TCP connection, so the sub-devices do not need a connection pool of their own.
+
 Example Usage:
 ```
 # Initialize the MCTOptics device
 optics = MCTOptics("2bm:MCTOptics:", name="optics")
 
+# Wait (up to 5 s overall) for every PV of the device tree to connect
+optics.wait_for_connection(timeout=5)
+
 # Access lens information
 lens_names = optics.lens_info.name_0.get()
 motor_name = optics.lens_info.motor_name.get()
 ```
 """
 
+import functools
+from pathlib import Path
+
+import yaml
 from ophyd import Component as Cpt
 from ophyd import Device
 from ophyd import EpicsSignal
 from ophyd import EpicsSignalRO
 from ophyd import FormattedComponent as FCpt
+from ophyd.device import create_device_from_components
+
+from .epics_signal_no_char_value import EpicsSignalNoCharValue
 
 
-class MCTOpticsLensInfo(Device):
+@functools.lru_cache(maxsize=None)
+def _split_prefix(prefix: str) -> tuple[str, str]:
     """
-    Class for managing lens metadata, motor, and focus-related PVs.
+    Splits an EPICS prefix into its base and its trailing number.
 
-    Attributes:
-        name_0 (EpicsSignal): PV for the name of lens 0.
-        name_1 (EpicsSignal): PV for the name of lens 1.
-        name_2 (EpicsSignal): PV for the name of lens 2.
-        motor_name (EpicsSignal): PV for the motor controlling the lens.
-        sample_x_name (EpicsSignal): PV for the X-axis sample motor.
-        sample_y_name (EpicsSignal): PV for the Y-axis sample motor.
-        sample_z_name (EpicsSignal): PV for the Z-axis sample motor.
-        focus_name_0 (EpicsSignal): PV for the focus of lens 0.
-        focus_name_1 (EpicsSignal): PV for the focus of lens 1.
-        focus_name_2 (EpicsSignal): PV for the focus of lens 2.
+    Example: ``"2bm:MCTOptics:Camera0"`` -> ``("2bm:MCTOptics:Camera", "0")``
+
+    Args:
+        prefix (str): The EPICS prefix.
+
+    Returns:
+        tuple: The base prefix and the trailing number (as str).
     """
+    split_index = len(prefix.rstrip("0123456789"))
+    return prefix[:split_index], prefix[split_index:]
+
 
-    name_0 = Cpt(EpicsSignal, "Name0")
-    name_1 = Cpt(EpicsSignal, "Name1")
-    name_2 = Cpt(EpicsSignal, "Name2")
+PV_SCHEMA_FILE = Path(__file__).parent.parent / "configs" / "mct_optics_pvs.yml"
 
-    # Lens Motor PVs
-    motor_name = Cpt(EpicsSignal, "MotorPVName")
-    sample_x_name = Cpt(EpicsSignal, "SampleXPVName")
-    sample_y_name = Cpt(EpicsSignal, "SampleYPVName")
-    sample_z_name = Cpt(EpicsSignal, "SampleZPVName")
 
-    # Lens Focus PVs
-    focus_name_0 = Cpt(EpicsSignal, "0FocusPVName")
-    focus_name_1 = Cpt(EpicsSignal, "1FocusPVName")
-    focus_name_2 = Cpt(EpicsSignal, "2FocusPVName")
+@functools.lru_cache(maxsize=None)
+def _read_pv_schema(path: Path) -> dict:
+    """Reads a PV schema file (once per process)."""
+    with open(path) as f:
+        return yaml.safe_load(f)
 
 
-class MCTOpticsLensOffset(Device):
+def load_pv_schema(section: str) -> tuple[tuple[str, str], ...]:
     """
-    Class for defining lens offsets.
+    Returns one section of the MCT Optics PV schema.
 
-    Attributes:
-        x_offset (EpicsSignal): X-axis offset PV.
-        y_offset (EpicsSignal): Y-axis offset PV.
-        z_offset (EpicsSignal): Z-axis offset PV.
-        rotation (EpicsSignal): Rotation offset PV.
-        focus (EpicsSignal): Focus offset PV.
+    Args:
+        section (str): Name of the section in ``PV_SCHEMA_FILE``.
+
+    Returns:
+        tuple: ``(attribute name, PV suffix)`` pairs, in file order.
+
+    Raises:
+        TypeError: If the section is missing, empty, or not a mapping,
+            or if a name or suffix is not a string.  (YAML reads
+            unquoted values such as ``1`` or ``On`` as int or bool.)
     """
+    schema = _read_pv_schema(PV_SCHEMA_FILE)
+    entries = schema.get(section) if isinstance(schema, dict) else None
+    if not entries or not isinstance(entries, dict):
+        raise TypeError(
+            f"{PV_SCHEMA_FILE.name} [{section}]: missing, empty, or not a"
+            f" mapping of attribute names to PV suffixes (got {entries!r})."
+        )
+    pvs = tuple(entries.items())
+    for attr, suffix in pvs:
+        if not isinstance(attr, str) or not isinstance(suffix, str):
+            raise TypeError(
+                f"{PV_SCHEMA_FILE.name} [{section}]: {attr!r}: {suffix!r}"
+                " must map a string to a string (quote it in the file)."
+            )
+    return pvs
+
+
+# PV schemas, shared with mct_optics_async.
+LENS_INFO_PVS = load_pv_schema("lens_info")
+LENS_OFFSET_PVS = load_pv_schema("lens_offset")
+
+
+def _schema_components(
+    schema: tuple[tuple[str, str], ...],
+    signal_class: type = EpicsSignal,
+    **kwargs,
+) -> dict[str, Cpt]:
+    """
+    Returns one ``Cpt(signal_class, suffix)`` per schema entry.
+
+    Args:
+        schema (tuple): ``(attribute name, PV suffix)`` pairs.
+        signal_class (type): Signal class of every component.
+        **kwargs: Additional keyword arguments for every component.
+
+    Returns:
+        dict: Components keyed by attribute name, in schema order.
+    """
+    return {attr: Cpt(signal_class, suffix, **kwargs) for attr, suffix in schema}
+
+
+MCTOpticsLensInfo = create_device_from_components(
+    "MCTOpticsLensInfo",
+    docstring="""
+    Class for managing lens metadata, motor, and focus-related PVs.
 
-    # Lens Offset
-    x_offset = Cpt(EpicsSignal, "XOffset")
-    y_offset = Cpt(EpicsSignal, "YOffset")
-    z_offset = Cpt(EpicsSignal, "ZOffset")
-    rotation = Cpt(EpicsSignal, "Rotation")
-    focus = Cpt(EpicsSignal, "Focus")
+    Attributes: one EpicsSignal per entry of the ``lens_info`` section of
+    ``configs/mct_optics_pvs.yml`` (lens names, motor and focus PV names).
+    """,
+    **_schema_components(LENS_INFO_PVS),
+)
+MCTOpticsLensInfo.__module__ = __name__
+
+
+MCTOpticsLensOffset = create_device_from_components(
+    "MCTOpticsLensOffset",
+    docstring="""
+    Class for defining lens offsets.
+
+    The offsets are monitored, so ``get()`` returns the last value sent by
+    the IOC instead of making a new Channel Access read.
+
+    Attributes: one EpicsSignalNoCharValue per entry of the ``lens_offset``
+    section of ``configs/mct_optics_pvs.yml`` (X, Y, Z, rotation and focus).
+    """,
+    **_schema_components(LENS_OFFSET_PVS, EpicsSignalNoCharValue, auto_monitor=True),
+)
+MCTOpticsLensOffset.__module__ = __name__
 
 
 class MCTOpticsLensControl(Device):
@@ -123,16 +196,13 @@ class MCTOpticsCameraControl(Device):
             **kwargs: Additional keyword arguments for the Device initializer.
         """
 
-        # Identify the position where the trailing number starts
-        split_index = len(prefix.rstrip("0123456789"))
-
-        # Separate the base prefix and the trailing number
-        self.base_prefix = prefix[:split_index]
-        self.last_number = prefix[split_index:]
+        self.base_prefix, self.last_number = _split_prefix(prefix)
 
         super().__init__(prefix, *args, **kwargs)
 
     # Name
+    # FCpt formats these PV names once, when the component is created;
+    # reconnects and monitor re-subscriptions reuse the same signal.
     pos = FCpt(EpicsSignal, "{base_prefix}Pos{last_number}")
     pv_name = FCpt(EpicsSignal, "{base_prefix}Name{last_number}")
 
@@ -194,4 +264,4 @@ class MCTOptics(Device):
 
     # Camera Lens Positions, Offsets, & Movement
     camera_0 = Cpt(MCTOpticsCameraControl, "Camera0")
-    camera_1 = Cpt(MCTOpticsCameraControl, "Camera1")
\ No newline at end of file
+    camera_1 = Cpt(MCTOpticsCameraControl, "Camera1")
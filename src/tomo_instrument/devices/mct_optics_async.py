@@ -0,0 +1,222 @@
+"""
+MCT Optics ophyd-async Device Classes
+
+Same PV layout as :mod:`tomo_instrument.devices.mct_optics`, built on
+`ophyd-async <https://blueskyproject.io/ophyd-async/>`_ so that several
+signals can be read or written concurrently.
+
+Example Usage:
+```
+# Initialize and connect the MCTOptics device
+optics = await MCTOptics.aconnect("2bm:MCTOptics:", name="optics")
+
+# Select the second lens and read its offsets for camera 0
+choices = (await optics.lens_select.describe())["optics-lens_select"]["choices"]
+await optics.lens_select.set(choices[1])
+offsets = await optics.camera[0].lens_ctrl.lens_1.get_offsets()
+```
+
+In a plan, ``bps.mv()`` sets all the given signals in parallel:
+```
+yield from bps.mv(optics.scintillator_thickness, 50, optics.detector_pixel_size, 3.45)
+```
+
+Selector and other enum (mbbo/bo/busy) PVs are ``str`` signals: they read
+and take the choice strings of the record, and the choices are in the
+signal metadata.  ``str`` also fits string and char waveform records.
+"""
+
+import asyncio
+
+from ophyd_async.core import DeviceVector
+from ophyd_async.core import StandardReadable
+from ophyd_async.epics.core import epics_signal_r
+from ophyd_async.epics.core import epics_signal_rw
+
+from .mct_optics import LENS_INFO_PVS
+from .mct_optics import LENS_OFFSET_PVS
+
+
+class MCTOpticsLensInfo(StandardReadable):
+    """
+    Class for managing lens metadata, motor, and focus-related PVs.
+
+    Attributes: see :class:`tomo_instrument.devices.mct_optics.MCTOpticsLensInfo`.
+    """
+
+    def __init__(self, prefix: str, name: str = "") -> None:
+        """
+        Initializes the lens information device.
+
+        Args:
+            prefix (str): The EPICS prefix for the device.
+            name (str): Name of the device.
+        """
+        with self.add_children_as_readables():
+            for attr, suffix in LENS_INFO_PVS:
+                setattr(self, attr, epics_signal_rw(str, f"{prefix}{suffix}"))
+        super().__init__(name=name)
+
+
+class MCTOpticsLensOffset(StandardReadable):
+    """
+    Class for defining lens offsets.
+
+    Attributes: see :class:`tomo_instrument.devices.mct_optics.MCTOpticsLensOffset`.
+    """
+
+    def __init__(self, prefix: str, name: str = "") -> None:
+        """
+        Initializes the lens offset device.
+
+        Args:
+            prefix (str): The EPICS prefix for the device.
+            name (str): Name of the device.
+        """
+        with self.add_children_as_readables():
+            for attr, suffix in LENS_OFFSET_PVS:
+                setattr(self, attr, epics_signal_rw(float, f"{prefix}{suffix}"))
+        super().__init__(name=name)
+
+    async def get_offsets(self) -> dict[str, float]:
+        """
+        Reads all offsets of this lens concurrently.
+
+        Returns:
+            dict: Offset values keyed by attribute name.
+        """
+        names = [attr for attr, _suffix in LENS_OFFSET_PVS]
+        values = await asyncio.gather(
+            *(getattr(self, name).get_value() for name in names)
+        )
+        return dict(zip(names, values, strict=True))
+
+
+class MCTOpticsLensControl(StandardReadable):
+    """
+    Class for managing lens positions and offsets.
+
+    Attributes: see :class:`tomo_instrument.devices.mct_optics.MCTOpticsLensControl`.
+    """
+
+    def __init__(self, prefix: str, name: str = "") -> None:
+        """
+        Initializes the lens control device.
+
+        Args:
+            prefix (str): The EPICS prefix for the device.
+            name (str): Name of the device.
+        """
+        with self.add_children_as_readables():
+            # Lens Positions
+            self.pos_0 = epics_signal_rw(float, f"{prefix}Pos0")
+            self.pos_1 = epics_signal_rw(float, f"{prefix}Pos1")
+            self.pos_2 = epics_signal_rw(float, f"{prefix}Pos2")
+            self.lens_1 = MCTOpticsLensOffset(f"{prefix}1")
+            self.lens_2 = MCTOpticsLensOffset(f"{prefix}2")
+        super().__init__(name=name)
+
+
+class MCTOpticsCameraControl(StandardReadable):
+    """
+    Class for managing camera control parameters.
+
+    Attributes: see :class:`tomo_instrument.devices.mct_optics.MCTOpticsCameraControl`.
+    """
+
+    def __init__(self, prefix: str, number: int, name: str = "") -> None:
+        """
+        Initializes the camera control device.
+
+        Args:
+            prefix (str): The EPICS prefix of the cameras, without the
+                camera number (such as ``"2bm:MCTOptics:Camera"``).
+            number (int): The camera number.
+            name (str): Name of the device.
+        """
+        with self.add_children_as_readables():
+            # Name
+            self.pos = epics_signal_rw(float, f"{prefix}Pos{number}")
+            self.pv_name = epics_signal_rw(str, f"{prefix}Name{number}")
+
+            # Camera Rotation PV Name
+            self.rotation_name = epics_signal_rw(str, f"{prefix}{number}RotationPVName")
+
+            # Lens Control
+            self.lens_ctrl = MCTOpticsLensControl(f"{prefix}{number}Lens")
+        super().__init__(name=name)
+
+
+class MCTOptics(StandardReadable):
+    """
+    ophyd-async Device Class for controlling MCT optics via EPICS.
+
+    Attributes: see :class:`tomo_instrument.devices.mct_optics.MCTOptics`,
+    except that the cameras are ``camera[0]`` and ``camera[1]``.
+    """
+
+    def __init__(self, prefix: str, name: str = "") -> None:
+        """
+        Initializes the MCT optics device.
+
+        Args:
+            prefix (str): The EPICS prefix for the device.
+            name (str): Name of the device.
+        """
+        with self.add_children_as_readables():
+            # Configurable PVs
+            self.lens_select = epics_signal_rw(str, f"{prefix}LensSelect")
+            self.camera_select = epics_signal_rw(str, f"{prefix}CameraSelect")
+            self.camera_selected = epics_signal_r(str, f"{prefix}CameraSelected")
+
+            self.cross_select = epics_signal_rw(str, f"{prefix}CrossSelect")
+            self.sync = epics_signal_rw(str, f"{prefix}Sync")
+            self.server_running = epics_signal_rw(str, f"{prefix}ServerRunning")
+            self.mct_status = epics_signal_rw(str, f"{prefix}MCTStatus")
+
+            # Scintillator Information
+            self.scintillator_type = epics_signal_rw(str, f"{prefix}ScintillatorType")
+            self.scintillator_thickness = epics_signal_rw(
+                float, f"{prefix}ScintillatorThickness"
+            )
+
+            # Image and Detector Pixel Size
+            self.image_pixel_size = epics_signal_rw(float, f"{prefix}ImagePixelSize")
+            self.detector_pixel_size = epics_signal_rw(
+                float, f"{prefix}DetectorPixelSize"
+            )
+
+            # Camera Objectives
+            self.camera_objective = epics_signal_rw(str, f"{prefix}CameraObjective")
+            self.camera_tube_length = epics_signal_rw(str, f"{prefix}CameraTubeLength")
+
+            # Lens Names
+            self.lens_info = MCTOpticsLensInfo(f"{prefix}Lens")
+
+            # Camera Lens Positions, Offsets, & Movement
+            self.camera = DeviceVector(
+                {i: MCTOpticsCameraControl(f"{prefix}Camera", i) for i in (0, 1)}
+            )
+        super().__init__(name=name)
+
+    @classmethod
+    async def aconnect(
+        cls, prefix: str, name: str = "", timeout: float = 10.0
+    ) -> "MCTOptics":
+        """
+        Creates an MCTOptics device and connects all of its PVs.
+
+        ophyd-async connects every signal of the device tree concurrently,
+        so this takes about one network round trip.
+
+        Args:
+            prefix (str): The EPICS prefix for the device.
+            name (str): Name of the device.
+            timeout (float): Time (seconds) allowed for all PVs to connect.
+
+        Returns:
+            MCTOptics: The connected device.
+        """
+        device = cls(prefix, name=name)
+        await device.connect(timeout=timeout)
+        return device
@@ -10,6 +10,7 @@ Includes:
 """
 
 import logging
+import os
 from pathlib import Path
 
 from apsbits.core.best_effort_init import init_bec_peaks
@@ -39,6 +40,14 @@ iconfig = get_config()
 
 logger.info("Starting Instrument with iconfig: %s", iconfig_path)
 
+# Send all Channel Access traffic through a local CA gateway, if configured.
+# Must be set before the first PV is created.
+ca_gateway = iconfig.get("OPHYD", {}).get("CA_GATEWAY")
+if ca_gateway:
+    os.environ["EPICS_CA_ADDR_LIST"] = ca_gateway
+    os.environ["EPICS_CA_AUTO_ADDR_LIST"] = "NO"
+    logger.info("Using CA gateway: %s", ca_gateway)
+
 # Discard oregistry items loaded above.
 oregistry.clear()
 
@@ -51,7 +60,14 @@ register_bluesky_magics()
 # Initialize core bluesky components
 bec, peaks = init_bec_peaks(iconfig)
 cat = init_catalog(iconfig)
-RE, sd = init_RE(iconfig, bec_instance=bec, cat_instance=cat)
+
+# ophyd.set_cl(), called by init_RE(), does not know the epics-rs control layer.
+if iconfig.get("OPHYD", {}).get("CONTROL_LAYER", "").lower() == "epicsrs":
+    from .utils.epicsrs import init_RE_epicsrs
+
+    RE, sd = init_RE_epicsrs(iconfig, bec_instance=bec, cat_instance=cat)
+else:
+    RE, sd = init_RE(iconfig, bec_instance=bec, cat_instance=cat)
 
 # Import optional components based on configuration
 if iconfig.get("NEXUS_DATA_FILES", {}).get("ENABLE", False):
@@ -0,0 +1,117 @@
+"""Test EpicsSignalNoCharValue against a caproto IOC."""
+
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+IOC_SOURCE = """
+from caproto.server import PVGroup, pvproperty, run, template_arg_parser
+
+
+class LensOffsetIOC(PVGroup):
+    XOffset = pvproperty(value=1.5, precision=3)
+    YOffset = pvproperty(value=0.0, precision=3)
+    ZOffset = pvproperty(value=0.0, precision=3)
+    Rotation = pvproperty(value=0.0, precision=3)
+    Focus = pvproperty(value=0.0, precision=3)
+
+
+parser, split_args = template_arg_parser(default_prefix="T:", desc="test IOC")
+ioc_options, run_options = split_args(parser.parse_args())
+run(LensOffsetIOC(**ioc_options).pvdb, **run_options)
+"""
+
+
+def _free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# Must be set before pyepics creates its CA context.
+IOC_PORT = str(_free_port())
+os.environ.update(
+    {
+        "EPICS_CA_ADDR_LIST": "127.0.0.1",
+        "EPICS_CA_AUTO_ADDR_LIST": "NO",
+        "EPICS_CA_SERVER_PORT": IOC_PORT,
+        "EPICS_CAS_SERVER_PORT": IOC_PORT,
+        "EPICS_CAS_INTF_ADDR_LIST": "127.0.0.1",
+        "EPICS_CAS_BEACON_ADDR_LIST": "127.0.0.1",
+    }
+)
+
+
+@pytest.fixture(scope="module")
+def ioc(tmp_path_factory):
+    """Run a caproto IOC serving T:XOffset, ... on localhost."""
+    pytest.importorskip("caproto")
+    script = tmp_path_factory.mktemp("ioc") / "ioc.py"
+    script.write_text(IOC_SOURCE)
+    process = subprocess.Popen([sys.executable, str(script)], env=os.environ)
+    yield "T:"
+    process.terminate()
+    process.wait(timeout=10)
+
+
+def _wait_for_value(signal, value, timeout=5):
+    deadline = time.monotonic() + timeout
+    while signal.get() != value and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return signal.get()
+
+
+def test_string_true_raises():
+    """string=True is rejected, char_value is not kept up to date."""
+    from tomo_instrument.devices.epics_signal_no_char_value import (
+        EpicsSignalNoCharValue,
+    )
+
+    with pytest.raises(ValueError):
+        EpicsSignalNoCharValue("T:XOffset", name="sig", string=True)
+
+
+def test_destroy_keeps_shared_channel(ioc):
+    """Destroying one device leaves the other's channels and monitors working."""
+    from tomo_instrument.devices.mct_optics import MCTOpticsLensOffset
+
+    a = MCTOpticsLensOffset(ioc, name="a")
+    b = MCTOpticsLensOffset(ioc, name="b")
+    a.wait_for_connection(timeout=10)
+    b.wait_for_connection(timeout=10)
+
+    a.destroy()
+    assert b.x_offset.connected
+
+    b.x_offset.put(7.25, wait=True)
+    assert _wait_for_value(b.x_offset, 7.25) == 7.25  # monitor still alive
+
+    b.destroy()  # no "Unexpected channel ID"
+
+
+def test_string_signal_keeps_char_value(ioc):
+    """A string signal of the same PV still gets char_value."""
+    from ophyd import EpicsSignal
+    from tomo_instrument.devices.epics_signal_no_char_value import (
+        EpicsSignalNoCharValue,
+    )
+
+    text = EpicsSignal(f"{ioc}YOffset", name="text", string=True, auto_monitor=True)
+    number = EpicsSignalNoCharValue(f"{ioc}YOffset", name="number", auto_monitor=True)
+    text.wait_for_connection(timeout=10)
+    number.wait_for_connection(timeout=10)
+    assert text._read_pv is not number._read_pv
+
+    number.put(2.5, wait=True)
+    assert _wait_for_value(number, 2.5) == 2.5
+    assert _wait_for_value(text, "2.500") == "2.500"
+    assert number.get(as_string=True) == "2.500"
+
+    number.destroy()
+    text.put("3.5", wait=True)
+    assert _wait_for_value(text, "3.500") == "3.500"
+    text.destroy()
@@ -0,0 +1,61 @@
+"""
+Initialize the RunEngine with the epics-rs ophyd control layer.
+
+``OPHYD.CONTROL_LAYER: epicsrs`` in ``iconfig.yml`` selects the Rust Channel
+Access client of the ``ophyd-epicsrs`` package
+(``pip install tomo_instrument[epicsrs]``).
+"""
+
+import logging
+
+from apsbits.core.run_engine_init import init_RE
+from apsbits.utils.controls_setup import connect_scan_id_pv
+
+logger = logging.getLogger(__name__)
+logger.bsdev(__file__)
+
+CONTROL_LAYER = "epicsrs"
+
+
+def init_RE_epicsrs(iconfig, **kwargs):
+    """
+    Calls ``init_RE()`` and switches ophyd to the epics-rs control layer.
+
+    This depends on what ``init_RE()`` does in apsbits 2.0.4: it calls
+    ``ophyd.set_cl()`` (which does not know epics-rs) with
+    ``OPHYD.CONTROL_LAYER``, then connects ``RUN_ENGINE.SCAN_ID_PV``, the
+    first EpicsSignal of the session.  So ``init_RE()`` is given
+    ``PyEpics`` and no ``SCAN_ID_PV``, epics-rs is installed, and the scan_id
+    PV is connected afterwards.  Check this again when apsbits is updated.
+
+    Args:
+        iconfig (dict): The instrument configuration.
+        **kwargs: Keyword arguments for ``init_RE()``.
+
+    Returns:
+        tuple: The RunEngine and its SupplementalData, as from ``init_RE()``.
+
+    Raises:
+        ImportError: If ``ophyd-epicsrs`` is not installed.
+    """
+    try:
+        from ophyd_epicsrs import use_epicsrs
+    except ImportError as exc:
+        raise ImportError(
+            f"OPHYD.CONTROL_LAYER: {CONTROL_LAYER} needs the ophyd-epicsrs package:"
+            " pip install tomo_instrument[epicsrs]"
+        ) from exc
+
+    ophyd_config = iconfig.get("OPHYD", {})
+    re_config = iconfig.get("RUN_ENGINE", {})
+    re_iconfig = {
+        **iconfig,
+        "OPHYD": {**ophyd_config, "CONTROL_LAYER": "PyEpics"},
+        "RUN_ENGINE": {k: v for k, v in re_config.items() if k != "SCAN_ID_PV"},
+    }
+    RE, sd = init_RE(re_iconfig, **kwargs)
+
+    use_epicsrs()
+    logger.info("using ophyd control layer: %r", CONTROL_LAYER)
+    connect_scan_id_pv(RE, pv=re_config.get("SCAN_ID_PV"))
+    return RE, sd